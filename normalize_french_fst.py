@@ -22,6 +22,10 @@ Date: Novembre 2025
 =============================================================================
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 import pynini
 from pynini.lib import pynutil, utf8
 import re
@@ -31,80 +35,85 @@ import re
 # SECTION 1: RÈGLES LINGUISTIQUES FRANÇAISES (Définitions)
 # =============================================================================
 
-class FrenchLinguisticRules:
-    """
-    Classe encapsulant toutes les règles linguistiques du français
-    pour la verbalisation des nombres cardinaux
-    """
+# Les règles ne portent aucun état d'instance: elles vivent comme
+# constantes et fonctions libres au niveau du module (aucune
+# instanciation, accès direct, picklable pour un éventuel multiprocessing)
 
-    # Règle 1: Unités de base
-    UNITS = {
-        0: "zéro", 1: "un", 2: "deux", 3: "trois", 4: "quatre",
-        5: "cinq", 6: "six", 7: "sept", 8: "huit", 9: "neuf"
-    }
+# Règle 1: Unités de base
+UNITS = {
+    0: "zéro", 1: "un", 2: "deux", 3: "trois", 4: "quatre",
+    5: "cinq", 6: "six", 7: "sept", 8: "huit", 9: "neuf"
+}
 
-    # Règle 2: Nombres spéciaux 10-16 (formes irrégulières)
-    TEENS_SPECIAL = {
-        10: "dix", 11: "onze", 12: "douze", 13: "treize",
-        14: "quatorze", 15: "quinze", 16: "seize"
-    }
+# Règle 2: Nombres spéciaux 10-16 (formes irrégulières)
+TEENS_SPECIAL = {
+    10: "dix", 11: "onze", 12: "douze", 13: "treize",
+    14: "quatorze", 15: "quinze", 16: "seize"
+}
 
-    # Règle 3: 17-19 (dix-sept, dix-huit, dix-neuf)
-    TEENS_COMPOSED = {
-        17: "dix-sept", 18: "dix-huit", 19: "dix-neuf"
-    }
+# Règle 3: 17-19 (dix-sept, dix-huit, dix-neuf)
+TEENS_COMPOSED = {
+    17: "dix-sept", 18: "dix-huit", 19: "dix-neuf"
+}
 
-    # Règle 4: Bases des dizaines (20-60)
-    TENS_BASES = {
-        2: "vingt", 3: "trente", 4: "quarante",
-        5: "cinquante", 6: "soixante"
-    }
+# Fusion 10-19 précalculée une seule fois (évite de refusionner
+# les deux dictionnaires à chaque appel des constructeurs)
+ALL_TEENS = {**TEENS_SPECIAL, **TEENS_COMPOSED}
 
-    # Règle 5: Bases des centaines
-    HUNDREDS_PREFIXES = {
-        1: "", 2: "deux", 3: "trois", 4: "quatre", 5: "cinq",
-        6: "six", 7: "sept", 8: "huit", 9: "neuf"
-    }
+# Règle 4: Bases des dizaines (20-60)
+TENS_BASES = {
+    2: "vingt", 3: "trente", 4: "quarante",
+    5: "cinquante", 6: "soixante"
+}
 
-    @staticmethod
-    def apply_et_rule(number):
-        """
-        RÈGLE LINGUISTIQUE 1: Conjonction "et"
+# Règle 5: Bases des centaines
+HUNDREDS_PREFIXES = {
+    1: "", 2: "deux", 3: "trois", 4: "quatre", 5: "cinq",
+    6: "six", 7: "sept", 8: "huit", 9: "neuf"
+}
 
-        Les nombres se terminant par 1 (21, 31, 41, 51, 61, 71)
-        utilisent "et" au lieu d'un tiret.
+# Exceptions de la règle "et" (test d'appartenance en O(1))
+ET_EXCEPTIONS = frozenset({11, 81, 91})
 
-        EXCEPTIONS: 11, 81, 91 n'utilisent PAS "et"
-        """
-        return number % 10 == 1 and number not in [11, 81, 91]
 
-    @staticmethod
-    def apply_s_to_cents(number):
-        """
-        RÈGLE LINGUISTIQUE 2: Accord de "cent"
+def apply_et_rule(number):
+    """
+    RÈGLE LINGUISTIQUE 1: Conjonction "et"
 
-        "cent" prend un 's' uniquement quand:
-        - C'est un multiple exact de 100 (200, 300, ...)
-        - Il n'est PAS suivi d'un autre nombre
+    Les nombres se terminant par 1 (21, 31, 41, 51, 61, 71)
+    utilisent "et" au lieu d'un tiret.
 
-        Exemples:
-            200 → "deux cents" (avec 's')
-            201 → "deux cent un" (sans 's')
-        """
-        return number >= 200 and number % 100 == 0
+    EXCEPTIONS: 11, 81, 91 n'utilisent PAS "et"
+    """
+    return number % 10 == 1 and number not in ET_EXCEPTIONS
 
-    @staticmethod
-    def apply_s_to_vingts(number):
-        """
-        RÈGLE LINGUISTIQUE 3: Accord de "vingt" dans "quatre-vingt"
 
-        "vingt" prend un 's' uniquement pour 80 exact
+def apply_s_to_cents(number):
+    """
+    RÈGLE LINGUISTIQUE 2: Accord de "cent"
+
+    "cent" prend un 's' uniquement quand:
+    - C'est un multiple exact de 100 (200, 300, ...)
+    - Il n'est PAS suivi d'un autre nombre
 
-        Exemples:
-            80 → "quatre-vingts" (avec 's')
-            81 → "quatre-vingt-un" (sans 's')
-        """
-        return number == 80
+    Exemples:
+        200 → "deux cents" (avec 's')
+        201 → "deux cent un" (sans 's')
+    """
+    return number >= 200 and number % 100 == 0
+
+
+def apply_s_to_vingts(number):
+    """
+    RÈGLE LINGUISTIQUE 3: Accord de "vingt" dans "quatre-vingt"
+
+    "vingt" prend un 's' uniquement pour 80 exact
+
+    Exemples:
+        80 → "quatre-vingts" (avec 's')
+        81 → "quatre-vingt-un" (sans 's')
+    """
+    return number == 80
 
 
 # =============================================================================
@@ -114,8 +123,13 @@ class FrenchLinguisticRules:
 def apply_fst(text, fst):
     """Applique un FST à un texte"""
     try:
+        # Entrée en 'byte': les chiffres sont ASCII, inutile de
+        # construire un accepteur utf8 par appel; la sortie reste
+        # décodée en utf8 (mots accentués). Le FST est fonctionnel:
+        # un seul chemin distinct suffit (nshortest=1, unique=True)
         return pynini.shortestpath(
-            pynini.accep(text, token_type='utf8') @ fst
+            pynini.accep(text, token_type='byte') @ fst,
+            nshortest=1, unique=True
         ).string("utf8")
     except Exception as e:
         return f"Error: {e}, for input:'{text}'"
@@ -128,40 +142,52 @@ def I_O_FST(input_str, output_str):
 
     input_accep = pynini.accep(input_str, token_type="utf8")
     output_accep = pynini.accep(output_str, token_type="utf8")
-    fst = pynini.cross(input_accep, output_accep)
 
-    return fst.optimize()
+    # Pas de .optimize() ici: déterminiser/minimiser un FST à un seul
+    # chemin est du pur surcoût; l'appelant optimise le résultat agrégé
+    return pynini.cross(input_accep, output_accep)
 
 
 # =============================================================================
 # SECTION 3: CONSTRUCTION DYNAMIQUE DES NOMBRES (Règles Appliquées)
 # =============================================================================
 
+def _compile_map(mapping):
+    """Compile un dict {chiffres: forme écrite} en FST optimisé (trie unique)"""
+    return pynini.string_map(
+        mapping.items(), input_token_type="utf8", output_token_type="utf8"
+    ).optimize()
+
+
+def build_units_map():
+    """
+    Table pour 0-9 (RÈGLE: Unités de base)
+    """
+    return {str(num): word for num, word in UNITS.items()}
+
+
 def build_units_fst():
     """
     FST pour 0-9 (RÈGLE: Unités de base)
     """
-    rules = FrenchLinguisticRules()
-    fst_list = [I_O_FST(str(num), word) for num, word in rules.UNITS.items()]
-    return pynini.union(*fst_list).optimize()
+    return _compile_map(build_units_map())
 
 
-def build_teens_fst():
+def build_teens_map():
     """
-    FST pour 10-19 (RÈGLE: Formes irrégulières + composition avec "dix")
+    Table pour 10-19 (RÈGLE: Formes irrégulières + composition avec "dix")
     """
-    rules = FrenchLinguisticRules()
-
-    # 10-16: formes spéciales
-    special_list = [I_O_FST(str(num), word) for num, word in rules.TEENS_SPECIAL.items()]
+    return {str(num): word for num, word in ALL_TEENS.items()}
 
-    # 17-19: composition avec "dix-"
-    composed_list = [I_O_FST(str(num), word) for num, word in rules.TEENS_COMPOSED.items()]
 
-    return pynini.union(*(special_list + composed_list)).optimize()
+def build_teens_fst():
+    """
+    FST pour 10-19 (RÈGLE: Formes irrégulières + composition avec "dix")
+    """
+    return _compile_map(build_teens_map())
 
 
-def build_compound_20_69_dynamic():
+def build_compound_20_69_map():
     """
     CONSTRUCTION DYNAMIQUE: 20-69 avec application des règles linguistiques
 
@@ -172,34 +198,42 @@ def build_compound_20_69_dynamic():
     Cette approche est ORIGINALE car elle construit dynamiquement
     au lieu de tout lister manuellement.
     """
-    rules = FrenchLinguisticRules()
+    # Alias locaux: évite les résolutions de globales dans la double boucle
+    units = UNITS
+    tens_bases = TENS_BASES
+    et_rule = apply_et_rule
     compound_map = {}
 
     for ten in range(2, 7):  # 20-60
         # Dizaine ronde (20, 30, 40, 50, 60)
         ten_value = ten * 10
-        compound_map[str(ten_value)] = rules.TENS_BASES[ten]
+        ten_word = tens_bases[ten]
+        compound_map[str(ten_value)] = ten_word
 
         # Nombres composés (21-29, 31-39, ...)
         for unit in range(1, 10):
             number = ten_value + unit
 
             # APPLICATION DE LA RÈGLE LINGUISTIQUE
-            if rules.apply_et_rule(number):
+            if et_rule(number):
                 # RÈGLE: x1 utilise "et"
                 connector = " et "
             else:
                 # RÈGLE: x2-x9 utilisent "-"
                 connector = "-"
 
-            word = f"{rules.TENS_BASES[ten]}{connector}{rules.UNITS[unit]}"
+            word = f"{ten_word}{connector}{units[unit]}"
             compound_map[str(number)] = word
 
-    fst_list = [I_O_FST(num, word) for num, word in compound_map.items()]
-    return pynini.union(*fst_list).optimize()
+    return compound_map
 
 
-def build_70_79_dynamic():
+def build_compound_20_69_dynamic():
+    """FST pour 20-69 (construction dynamique)"""
+    return _compile_map(build_compound_20_69_map())
+
+
+def build_70_79_map():
     """
     CONSTRUCTION DYNAMIQUE: 70-79 (Système soixante-dix)
 
@@ -209,11 +243,10 @@ def build_70_79_dynamic():
 
     Cette construction montre la compréhension du système vigésimal français.
     """
-    rules = FrenchLinguisticRules()
     seventy_map = {}
 
     # Base pour 70-79: "soixante" + nombres 10-19
-    teens_map = {**rules.TEENS_SPECIAL, **rules.TEENS_COMPOSED}
+    teens_map = ALL_TEENS
 
     for offset in range(10, 20):
         number = 60 + offset
@@ -230,11 +263,15 @@ def build_70_79_dynamic():
 
         seventy_map[str(number)] = word
 
-    fst_list = [I_O_FST(num, word) for num, word in seventy_map.items()]
-    return pynini.union(*fst_list).optimize()
+    return seventy_map
 
 
-def build_80_99_dynamic():
+def build_70_79_dynamic():
+    """FST pour 70-79 (construction dynamique)"""
+    return _compile_map(build_70_79_map())
+
+
+def build_80_99_map():
     """
     CONSTRUCTION DYNAMIQUE: 80-99 (Système quatre-vingt)
 
@@ -245,32 +282,36 @@ def build_80_99_dynamic():
 
     Construction originale qui démontre la compréhension du système vigésimal.
     """
-    rules = FrenchLinguisticRules()
+    units = UNITS
     eighty_map = {}
 
     # 80: cas spécial avec 's'
-    if rules.apply_s_to_vingts(80):
+    if apply_s_to_vingts(80):
         eighty_map["80"] = "quatre-vingts"
 
     # 81-89: quatre-vingt + unité (sans 's')
     for unit in range(1, 10):
         number = 80 + unit
-        word = f"quatre-vingt-{rules.UNITS[unit]}"
+        word = f"quatre-vingt-{units[unit]}"
         eighty_map[str(number)] = word
 
     # 90-99: quatre-vingt + (10-19)
-    teens_map = {**rules.TEENS_SPECIAL, **rules.TEENS_COMPOSED}
+    teens_map = ALL_TEENS
     for offset in range(10, 20):
         number = 80 + offset
         teen_word = teens_map.get(offset, "")
         word = f"quatre-vingt-{teen_word}"
         eighty_map[str(number)] = word
 
-    fst_list = [I_O_FST(num, word) for num, word in eighty_map.items()]
-    return pynini.union(*fst_list).optimize()
+    return eighty_map
 
 
-def build_hundreds_dynamic():
+def build_80_99_dynamic():
+    """FST pour 80-99 (construction dynamique)"""
+    return _compile_map(build_80_99_map())
+
+
+def build_hundreds_map():
     """
     CONSTRUCTION DYNAMIQUE: 100-999
 
@@ -281,7 +322,7 @@ def build_hundreds_dynamic():
 
     Construction sophistiquée qui réutilise les FST existants.
     """
-    rules = FrenchLinguisticRules()
+    hundreds_prefixes = HUNDREDS_PREFIXES
     hundreds_map = {}
 
     for h in range(1, 10):
@@ -291,10 +332,10 @@ def build_hundreds_dynamic():
         if h == 1:
             prefix = "cent"
         else:
-            prefix = f"{rules.HUNDREDS_PREFIXES[h]} cent"
+            prefix = f"{hundreds_prefixes[h]} cent"
 
         # APPLICATION DE LA RÈGLE D'ACCORD
-        if rules.apply_s_to_cents(hundred_value):
+        if apply_s_to_cents(hundred_value):
             hundreds_map[str(hundred_value)] = prefix + "s"
         else:
             hundreds_map[str(hundred_value)] = prefix
@@ -308,27 +349,32 @@ def build_hundreds_dynamic():
             word = f"{prefix} {unit_word}"
             hundreds_map[str(number)] = word
 
-    fst_list = [I_O_FST(num, word) for num, word in hundreds_map.items()]
-    return pynini.union(*fst_list).optimize()
+    return hundreds_map
+
+
+def build_hundreds_dynamic():
+    """FST pour 100-999 (construction dynamique)"""
+    return _compile_map(build_hundreds_map())
 
 
+@lru_cache(maxsize=128)
 def get_written_form_1_99_dynamic(n):
     """
     Fonction DYNAMIQUE pour obtenir la forme écrite de 1-99
 
     ORIGINALITÉ: Cette fonction applique dynamiquement les règles
     au lieu de chercher dans un dictionnaire statique.
-    """
-    rules = FrenchLinguisticRules()
 
+    Mémoïsée: build_hundreds_dynamic l'appelle 891 fois pour seulement
+    99 résultats distincts; le cache ne lit que des constantes du module.
+    """
     # 0-9
     if n < 10:
-        return rules.UNITS.get(n, str(n))
+        return UNITS.get(n, str(n))
 
     # 10-19
     if 10 <= n < 20:
-        all_teens = {**rules.TEENS_SPECIAL, **rules.TEENS_COMPOSED}
-        return all_teens.get(n, str(n))
+        return ALL_TEENS.get(n, str(n))
 
     # 20-69
     if 20 <= n < 70:
@@ -336,20 +382,20 @@ def get_written_form_1_99_dynamic(n):
         unit = n % 10
 
         if unit == 0:
-            return rules.TENS_BASES.get(ten, str(n))
+            return TENS_BASES.get(ten, str(n))
 
         # APPLICATION DE LA RÈGLE "et"
-        if rules.apply_et_rule(n):
+        if apply_et_rule(n):
             connector = " et "
         else:
             connector = "-"
 
-        return f"{rules.TENS_BASES[ten]}{connector}{rules.UNITS[unit]}"
+        return f"{TENS_BASES[ten]}{connector}{UNITS[unit]}"
 
     # 70-79
     if 70 <= n < 80:
         offset = n - 60
-        all_teens = {**rules.TEENS_SPECIAL, **rules.TEENS_COMPOSED}
+        all_teens = ALL_TEENS
 
         if n == 71:
             return "soixante et onze"
@@ -365,21 +411,59 @@ def get_written_form_1_99_dynamic(n):
 
         offset = n - 80
         if offset < 10:
-            return f"quatre-vingt-{rules.UNITS[offset]}"
+            return f"quatre-vingt-{UNITS[offset]}"
         else:
-            all_teens = {**rules.TEENS_SPECIAL, **rules.TEENS_COMPOSED}
-            return f"quatre-vingt-{all_teens.get(offset, str(offset))}"
+            return f"quatre-vingt-{ALL_TEENS.get(offset, str(offset))}"
 
     return str(n)
 
 
-def build_thousand_fst():
+def verbalize_cardinal(n):
+    """
+    Forme écrite d'un cardinal 0-1000 par arithmétique pure.
+
+    Même logique que les constructeurs de tables, mais sans passer par
+    le FST: le chemin d'exécution ne dépend plus de pynini, qui reste
+    réservé à la compilation et à l'export FAR.
+    """
+    if not 0 <= n <= 1000:
+        return str(n)
+
+    if n == 1000:
+        # RÈGLE: "mille" invariable
+        return "mille"
+
+    if n < 100:
+        if n == 0:
+            return UNITS[0]
+        return get_written_form_1_99_dynamic(n)
+
+    # 100-999
+    h, rest = divmod(n, 100)
+    if h == 1:
+        prefix = "cent"
+    else:
+        prefix = f"{HUNDREDS_PREFIXES[h]} cent"
+
+    if rest == 0:
+        # RÈGLE: 's' uniquement pour les multiples exacts de 100 (sauf 100)
+        return prefix + "s" if apply_s_to_cents(n) else prefix
+
+    return f"{prefix} {get_written_form_1_99_dynamic(rest)}"
+
+
+def build_thousand_map():
     """
-    FST pour 1000
+    Table pour 1000
 
     RÈGLE LINGUISTIQUE: "mille" est invariable (pas de 's')
     """
-    return I_O_FST("1000", "mille")
+    return {"1000": "mille"}
+
+
+def build_thousand_fst():
+    """FST pour 1000"""
+    return _compile_map(build_thousand_map())
 
 
 # =============================================================================
@@ -403,25 +487,20 @@ def build_french_cardinal_fst():
     print("   ├─ Application des règles d'accord (cent, vingt)")
     print("   └─ Optimisation FST\n")
 
-    # Construire tous les FST avec règles linguistiques
-    fst_units = build_units_fst()
-    fst_teens = build_teens_fst()
-    fst_compound_20_69 = build_compound_20_69_dynamic()
-    fst_70_79 = build_70_79_dynamic()
-    fst_80_99 = build_80_99_dynamic()
-    fst_hundreds = build_hundreds_dynamic()
-    fst_thousand = build_thousand_fst()
-
-    # Union de tous les FST
-    number_normalizer_fst = pynini.union(
-        fst_units,  # 0-9
-        fst_teens,  # 10-19
-        fst_compound_20_69,  # 20-69 (dynamique)
-        fst_70_79,  # 70-79 (dynamique)
-        fst_80_99,  # 80-99 (dynamique)
-        fst_hundreds,  # 100-999 (dynamique)
-        fst_thousand  # 1000
-    ).optimize()
+    # Fusionner toutes les tables construites avec règles linguistiques,
+    # puis compiler un trie unique: pas d'union NFA intermédiaire à
+    # déterminiser/minimiser sur l'alphabet combiné
+    cardinal_map = {
+        **build_units_map(),  # 0-9
+        **build_teens_map(),  # 10-19
+        **build_compound_20_69_map(),  # 20-69 (dynamique)
+        **build_70_79_map(),  # 70-79 (dynamique)
+        **build_80_99_map(),  # 80-99 (dynamique)
+        **build_hundreds_map(),  # 100-999 (dynamique)
+        **build_thousand_map(),  # 1000
+    }
+
+    number_normalizer_fst = _compile_map(cardinal_map)
 
     print("FST français complet créé avec succès!")
     print("   • Nombres couverts: 0-1000")
@@ -431,44 +510,132 @@ def build_french_cardinal_fst():
     return number_normalizer_fst
 
 
+# Cache module-level du FST compilé: la construction pynini (~1000 paires)
+# ne doit être payée qu'une seule fois par processus, pas à chaque
+# instanciation de FrenchNormalizer.
+_CARDINAL_FST = None
+
+# Fichier de persistance: un FST déjà optimisé se recharge en une passe,
+# sans repasser par la construction Python.
+_CARDINAL_FST_PATH = 'cardinal_french.fst'
+
+
+def _get_cardinal_fst():
+    """Retourne le FST cardinal compilé (construit une seule fois).
+
+    Ordre de résolution:
+        1. Cache mémoire du module (instanciations suivantes)
+        2. Fichier 'cardinal_french.fst' sur disque (démarrages suivants)
+        3. Construction complète via build_french_cardinal_fst()
+    """
+    global _CARDINAL_FST
+
+    if _CARDINAL_FST is None:
+        if os.path.exists(_CARDINAL_FST_PATH):
+            _CARDINAL_FST = pynini.Fst.read(_CARDINAL_FST_PATH)
+        else:
+            # Arcs triés sur les labels d'entrée: la composition avec
+            # l'accepteur du token devient linéaire en sa longueur
+            _CARDINAL_FST = build_french_cardinal_fst().arcsort('ilabel')
+            _CARDINAL_FST.write(_CARDINAL_FST_PATH)
+
+    return _CARDINAL_FST
+
+
+# Table précalculée 0-1000: remplie par le noyau arithmétique
+# verbalize_cardinal, sans aucune construction pynini. Liste contiguë
+# indexée par la valeur entière: un déréférencement direct, sans hachage
+# ni clés chaînes dupliquées.
+_VERBAL_TABLE = None
+
+
+def _get_verbal_table():
+    """Retourne la table [forme écrite de n] pour n dans 0-1000 (calculée une fois)."""
+    global _VERBAL_TABLE
+
+    if _VERBAL_TABLE is None:
+        _VERBAL_TABLE = [verbalize_cardinal(i) for i in range(1001)]
+
+    return _VERBAL_TABLE
+
+
 # =============================================================================
 # SECTION 5: TOKENISATION (inchangée)
 # =============================================================================
 
+# Motif compilé une seule fois au chargement du module. [^\W\d_]
+# équivaut à "lettre Unicode": classe de propriété compacte au lieu
+# d'énumérer chaque lettre accentuée dans une alternation large
+_TOKEN_RE = re.compile(r"\d+|[^\W\d_]+(?:'[^\W\d_]+)*|[^\w\s]|\s")
+
+
 def tokenize_text(text):
     """Tokenisation par regex"""
-    pattern = r"\d+|[a-zA-ZàâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ]+(?:['\''][a-zA-ZàâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ]+)*|[^\w\s]|\s"
-    return re.findall(pattern, text)
+    return _TOKEN_RE.findall(text)
 
 
 # =============================================================================
 # SECTION 6: CLASSIFICATION ET NORMALISATION (inchangée)
 # =============================================================================
 
-def classify_token(token, fst):
-    """Classifie un token (nombre ou mot)"""
-    if token.isdigit():
-        verbalized = apply_fst(token, fst)
+def classify_token(token, table):
+    """Classifie un token (nombre ou mot) via la table précalculée"""
+    # isdecimal() et non isdigit(): '²' passerait isdigit() mais
+    # ferait échouer int()
+    if token.isdecimal():
+        num = int(token)
+        verbalized = table[num] if num <= 1000 else token
         return f'{{ cardinal {{ integer: "{verbalized}" }} }}'
     else:
         return f'{{ word {{ value: "{token}" }} }}'
 
 
-def classify_sentence(text, fst):
+def classify_sentence(text, table):
     """Classifie tous les tokens d'une phrase"""
     tokens = tokenize_text(text)
-    return " ".join(classify_token(token, fst) for token in tokens)
+    return " ".join(classify_token(token, table) for token in tokens)
+
+
+# Motifs de suppression des tags, compilés une seule fois; les deux
+# formes de tag sont fusionnées en une alternation pour ne balayer le
+# document qu'une fois au lieu de deux
+_STRIP_TAGS_RE = re.compile(
+    r'\{ cardinal \{ integer: "([^"]+)" \} \}|\{ word \{ value: "([^"]+)" \} \}'
+)
+_SPACES_RE = re.compile(r'\s+')
+_SPACE_PUNCT_RE = re.compile(r'\s+([.,:;!?])')
 
 
 def strip_tags(tagged_text):
     """Supprime les tags pour obtenir le texte normalisé"""
-    tagged_text = re.sub(r'\{ cardinal \{ integer: "([^"]+)" \} \}', r'\1', tagged_text)
-    tagged_text = re.sub(r'\{ word \{ value: "([^"]+)" \} \}', r'\1', tagged_text)
-    tagged_text = re.sub(r'\s+', ' ', tagged_text)
-    tagged_text = re.sub(r'\s+([.,:;!?])', r'\1', tagged_text)
+    tagged_text = _STRIP_TAGS_RE.sub(lambda m: m.group(1) or m.group(2), tagged_text)
+    tagged_text = _SPACES_RE.sub(' ', tagged_text)
+    tagged_text = _SPACE_PUNCT_RE.sub(r'\1', tagged_text)
     return tagged_text.strip()
 
 
+def _normalize_text(text, table):
+    """Normalise un texte via la table indexée (chemin direct, sans tags)"""
+    # Substitution directe des tokens numériques: évite l'aller-retour
+    # tag/strip_tags (quatre passes regex) du chemin classifié
+    parts = []
+    for token in _TOKEN_RE.findall(text):
+        if token.isdecimal():
+            num = int(token)
+            if num <= 1000:
+                token = table[num]
+        parts.append(token)
+    joined = ''.join(parts)
+    joined = _SPACES_RE.sub(' ', joined)
+    joined = _SPACE_PUNCT_RE.sub(r'\1', joined)
+    return joined.strip()
+
+
+def _normalize_one(text):
+    """Worker de normalize_batch (niveau module: picklable)"""
+    return _normalize_text(text, _get_verbal_table())
+
+
 # =============================================================================
 # SECTION 7: CLASSE PRINCIPALE
 # =============================================================================
@@ -488,29 +655,57 @@ class FrenchNormalizer:
         """Initialise avec règles linguistiques"""
         print("\n🇫Initialisation du Normalizer Français")
         print("=" * 60)
-        self.rules = FrenchLinguisticRules()
-        self.fst = build_french_cardinal_fst()
+        self._table = _get_verbal_table()
         self.stats = {"normalized": 0, "errors": 0}
         print("=" * 60)
         print("Normalizer prêt avec 7 règles linguistiques actives!\n")
 
+    @property
+    def fst(self):
+        """FST cardinal compilé (construit paresseusement, pour l'export)"""
+        return _get_cardinal_fst()
+
     def normalize_number(self, number_str):
         """Normalise un nombre avec statistiques"""
-        try:
-            num = int(number_str)
-            if not (0 <= num <= 1000):
-                return number_str
-
-            result = apply_fst(str(num), self.fst)
-            self.stats["normalized"] += 1
-            return result
-        except:
+        # Validation explicite: pas de try/except nu sur le chemin chaud.
+        # isdecimal() et non isdigit(): ce dernier accepte des caractères
+        # que int() rejette ('²', '³', ...)
+        if not number_str.isdecimal():
             self.stats["errors"] += 1
             return number_str
 
+        num = int(number_str)
+        if num > 1000:
+            return number_str
+
+        result = self._table[num]
+        self.stats["normalized"] += 1
+        return result
+
     def normalize_text(self, text):
-        """Normalise un texte complet"""
-        tagged_text = classify_sentence(text, self.fst)
+        """Normalise un texte complet (chemin direct, sans tags)"""
+        return _normalize_text(text, self._table)
+
+    def normalize_batch(self, texts, max_workers=None):
+        """
+        Normalise une liste de textes en parallèle (un processus par cœur).
+
+        Le chemin direct est du pur Python (table + regex picklables),
+        donc le travail se répartit sans transporter d'objet pynini;
+        chaque worker reconstruit la table arithmétique à coût négligeable.
+        Pour quelques textes courts, normalize_text en boucle reste
+        plus rapide que le coût de démarrage des processus.
+        """
+        if not texts:
+            return []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunksize = max(1, len(texts) // ((os.cpu_count() or 1) * 4))
+            return list(executor.map(_normalize_one, texts, chunksize=chunksize))
+
+    def normalize_text_tagged(self, text):
+        """Normalise via la représentation taguée (chemin historique)"""
+        tagged_text = classify_sentence(text, self._table)
         normalized = strip_tags(tagged_text)
         return normalized
 
@@ -536,13 +731,14 @@ def normalize(text):
 # SECTION 8: TESTS AMÉLIORÉS
 # =============================================================================
 
-def run_comprehensive_tests():
+def run_comprehensive_tests(normalizer=None):
     """Tests avec vérification des règles linguistiques"""
     print("=" * 80)
     print("TESTS AVEC VÉRIFICATION DES RÈGLES LINGUISTIQUES")
     print("=" * 80)
 
-    normalizer = FrenchNormalizer()
+    if normalizer is None:
+        normalizer = FrenchNormalizer()
 
     # Test des règles linguistiques
     print("\nVÉRIFICATION DES RÈGLES LINGUISTIQUES")
@@ -606,10 +802,12 @@ def run_comprehensive_tests():
 # =============================================================================
 
 if __name__ == "__main__":
-    run_comprehensive_tests()
+    # Une seule instance partagée entre les tests et l'export: pas de
+    # reconstruction inutile
+    normalizer = FrenchNormalizer()
+    run_comprehensive_tests(normalizer)
 
     print("\nExport du FST...")
-    normalizer = FrenchNormalizer()
     normalizer.export_to_far('cardinal_french.far')
 
     print("\n" + "=" * 80)